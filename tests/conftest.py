@@ -1,28 +1,38 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
+import random
 import secrets
-from collections.abc import Generator
+from base64 import urlsafe_b64encode
+from binascii import hexlify
+from collections.abc import Callable, Generator, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from secrets import token_hex, token_urlsafe
+from secrets import token_bytes
 from typing import Any
 
 import pytest
-import yaml
 
 ASSETS: Path = Path(__file__).parent / "assets"
 DEFAULT_KEYS_PROB: int = 5
 DEFAULT_NESTED_KEYS_PROB: int = 5
 DEFAULT_MAX_DEPTH: int = 3
+DUMMY_VALUE_NBYTES: int = 6
+WRITE_POOL_THRESHOLD: int = 4
 
+_RNG = random.Random(token_bytes(16))  # noqa: S311
 
-# Check for existance of the assets folder.
-if not ASSETS.exists():
-    logging.info(f"Creating test assets folder ``{ASSETS}``.")
-    ASSETS.mkdir(parents=True)
-elif not ASSETS.is_dir():
+
+# Ensure the assets folder exists. ``mkdir`` raises ``FileExistsError`` only
+# when something other than a directory is in the way.
+try:
+    ASSETS.mkdir(parents=True, exist_ok=True)
+except FileExistsError as err:
     logging.critical(f"``{ASSETS} is not a directory, but it must be.")
-    raise Exception(f"``{ASSETS}`` must be a folder.")
+    raise Exception(f"``{ASSETS}`` must be a folder.") from err
 
 
 def _create_dummy(
@@ -33,36 +43,62 @@ def _create_dummy(
 ) -> dict[str, Any]:
     """Create a dummy data to attempt to load.
 
+    The tree is built iteratively and all of its random values are drawn from
+    a single call to :func:`secrets.token_bytes`, encoded once and sliced.
+
     :param keys: Keys to populate data for.
     :param nested_keys: Keys to nest at.
     :param max_depth: How far can nesting go.
-    :param current_depth: Recursion depth.
+    :param current_depth: Starting depth.
     :returns: A dummy dictionary.
     """
 
-    # Generate keys for our random dictionary.
-    result = {key: token_urlsafe(8) for key in keys}
-
-    # Check recursion limit.
-    if nested_keys is not None and -1 < current_depth < max_depth:
-        result.update(
-            iter(
-                (
-                    key,
-                    _create_dummy(
-                        keys,
-                        nested_keys=nested_keys,
-                        max_depth=max_depth,
-                        current_depth=current_depth + 1,
-                    ),
-                )
-                for key in nested_keys
-            ),  # type: ignore
-        )
+    # Count the nodes in the tree so that randomness can be drawn in bulk.
+    levels = max_depth - current_depth if nested_keys is not None and current_depth > -1 else 0
+    n_nested = len(nested_keys) if nested_keys is not None else 0
+    n_nodes = sum(n_nested**level for level in range(max(levels, 0) + 1))
+
+    # NOTE: ``DUMMY_VALUE_NBYTES`` is a multiple of three, so every value
+    #       encodes to exactly ``width`` characters without padding.
+    width = DUMMY_VALUE_NBYTES // 3 * 4
+    encoded = urlsafe_b64encode(token_bytes(n_nodes * len(keys) * DUMMY_VALUE_NBYTES)).decode()
+    values = [encoded[i : i + width] for i in range(0, len(encoded), width)]
+    n_keys = len(keys)
+    offset = n_keys
+
+    # NOTE: Bind the names used per node to locals.
+    _dict, _zip = dict, zip
+    result: dict[str, Any] = _dict(_zip(keys, values[:n_keys]))
+    stack: list[tuple[dict[str, Any], int]] = [(result, current_depth)]
+    pop, push = stack.pop, stack.append
+    while stack:
+        node, depth = pop()
+
+        # Check depth limit.
+        if nested_keys is None or not -1 < depth < max_depth:
+            continue
+
+        for key in nested_keys:
+            node[key] = child = _dict(_zip(keys, values[offset : offset + n_keys]))
+            offset += n_keys
+            push((child, depth + 1))
 
     return result
 
 
+def _hex_tokens(n: int, nbytes: int = 8) -> tuple[str, ...]:
+    """Equivalent to ``n`` calls of ``token_hex(nbytes)`` using one call to
+    :func:`secrets.token_bytes`.
+    """
+
+    if not n:
+        return ()
+
+    width = 2 * nbytes
+    raw = hexlify(token_bytes(n * nbytes)).decode()
+    return tuple(raw[i : i + width] for i in range(0, n * width, width))
+
+
 def create_dummies(
     keys: tuple[str, ...] | None = None,
     nested_keys: tuple[str, ...] | None = None,
@@ -75,40 +111,150 @@ def create_dummies(
     """
 
     _keys: tuple[str, ...] = (
-        keys if keys is not None else tuple(token_hex(8) for _ in range(0, secrets.randbelow(DEFAULT_KEYS_PROB)))
+        keys if keys is not None else _hex_tokens(secrets.randbelow(DEFAULT_KEYS_PROB))
     )
     _nested_keys: tuple[str, ...] = (
         nested_keys
         if nested_keys is not None
-        else tuple(token_hex(8) for _ in range(0, secrets.randbelow(DEFAULT_NESTED_KEYS_PROB)))
+        else _hex_tokens(secrets.randbelow(DEFAULT_NESTED_KEYS_PROB))
     )
     n_results = n_results if n_results is not None else secrets.choice(range(1, 26))
     max_depth = max_depth if max_depth is not None else DEFAULT_MAX_DEPTH
-    return tuple(
-        item
-        for item in (_create_dummy(_keys, nested_keys=_nested_keys, max_depth=max_depth) for _ in range(n_results))
-        if item is not None
-    )
+    return tuple(_create_dummy(_keys, nested_keys=_nested_keys, max_depth=max_depth) for _ in range(n_results))
+
+
+def _fast_names(n: int) -> tuple[str, ...]:
+    """Create :param:`n` distinct file names.
+
+    These only need to avoid collisions, so :data:`_RNG` is used instead of
+    the ``secrets`` module.
+    """
+
+    names: dict[str, None] = {}
+    while len(names) < n:
+        names[urlsafe_b64encode(_RNG.randbytes(6)).decode()] = None
+
+    return tuple(names)
+
+
+def _map_io(fn: Callable[[Any, bytes], object], targets: Sequence[Any], payloads: Sequence[bytes]) -> None:
+    """Call :param:`fn` for each target and payload, overlapping the calls in
+    a thread pool once there are enough of them to pay for its setup.
+    """
+
+    if len(targets) < WRITE_POOL_THRESHOLD:
+        for target, payload in zip(targets, payloads):
+            fn(target, payload)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(32, len(targets))) as executor:
+        # NOTE: Consume the results so that exceptions are raised here.
+        for _ in executor.map(fn, targets, payloads):
+            pass
+
 
+def _write_all(fd: int, payload: bytes) -> None:
+    """Write all of :param:`payload`, as ``os.write`` may write less."""
 
-def write_dummies(dummies: tuple[dict[str, Any], ...]) -> tuple[Path, ...]:
-    """Write the dummies to some files."""
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view) :]
 
-    filenames = tuple(ASSETS / token_urlsafe(8) for _ in range(len(dummies)))
-    for filepath, dummy in zip(filenames, dummies):
-        with filepath.open("w") as file:
-            yaml.dump(dummy, file)
+
+def _write_file(filepath: Path, payload: bytes) -> None:
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        _write_all(fd, payload)
+    finally:
+        os.close(fd)
+
+
+def _write_tmpfiles(payloads: tuple[bytes, ...]) -> tuple[int, ...] | None:
+    """Write :param:`payloads` to anonymous ``O_TMPFILE`` files in ``ASSETS``.
+
+    :returns: The open descriptors, or ``None`` when the platform or
+        filesystem does not support ``O_TMPFILE``.
+    """
+
+    if not hasattr(os, "O_TMPFILE"):
+        return None
+
+    fds: list[int] = []
+    try:
+        for _ in payloads:
+            fds.append(os.open(ASSETS, os.O_TMPFILE | os.O_WRONLY, 0o600))
+        _map_io(_write_all, fds, payloads)
+    except OSError:
+        for fd in fds:
+            os.close(fd)
+        return None
+
+    return tuple(fds)
+
+
+def write_dummies(
+    dummies: tuple[dict[str, Any], ...],
+    fds: list[int] | None = None,
+) -> tuple[Path, ...]:
+    """Write the dummies to some files.
+
+    All payloads are serialized before any file is touched so that each file
+    costs exactly one ``open``/``write``/``close``.
+
+    :param fds: When provided, try to write anonymous files instead. Their
+        descriptors are appended to :param:`fds` and each file disappears
+        once its descriptor is closed, so no cleanup is required.
+    """
+
+    # NOTE: The dummies are plain string mappings, so emit ``JSON`` (which is
+    #       valid ``YAML``) using the C accelerated ``json`` encoder.
+    payloads = tuple(json.dumps(dummy, separators=(",", ":")).encode() for dummy in dummies)
+    if fds is not None and (opened := _write_tmpfiles(payloads)) is not None:
+        fds.extend(opened)
+        return tuple(Path(f"/proc/self/fd/{fd}") for fd in opened)
+
+    filenames = tuple(ASSETS / name for name in _fast_names(len(dummies)))
+    _map_io(_write_file, filenames, payloads)
 
     return filenames
 
 
+@dataclass(frozen=True)
+class FileDummies:
+    """Dummy files and their contents as parallel tuples.
+
+    Iterating yields :attr:`paths`, so ``set(file_dummies)`` gives the paths.
+    """
+
+    __slots__ = ("paths", "payloads")
+
+    paths: tuple[Path, ...]
+    payloads: tuple[dict[str, Any], ...]
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
 @pytest.fixture
-def file_dummies(request: Any) -> Generator[dict[Path, dict[str, Any]], None, None]:
+def file_dummies(request: Any) -> Generator[FileDummies, None, None]:
     kwargs = request.params if hasattr(request, "params") else {}
     dummies = create_dummies(**kwargs)
-    filenames = write_dummies(dummies)
+    fds: list[int] = []
+    filenames = write_dummies(dummies, fds)
+
+    yield FileDummies(filenames, dummies)
 
-    yield dict(zip(filenames, dummies))
+    # NOTE: Anonymous files vanish when closed, so there is nothing to unlink.
+    if fds:
+        for fd in fds:
+            os.close(fd)
+        return
 
-    kill = (Path(filename).unlink() for filename in filenames)  # type: ignore
-    next((item is not None for item in kill), None)
+    for filename in filenames:
+        try:
+            filename.unlink()
+        except FileNotFoundError:
+            pass
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import json
 from shutil import get_terminal_size
 
@@ -9,12 +10,15 @@ from yaml_settings_pydantic import BaseYamlSettings
 
 from . import ExplicitSettings, MinimalSettings, SubpathSettings
 
-SEP = get_terminal_size().columns * "="
+
+@functools.cache
+def _sep() -> str:
+    return "=" * get_terminal_size().columns
 
 
 def show(config_cls: type[BaseYamlSettings]) -> None:
     settings = config_cls()
-    print(SEP)
+    print(_sep())
     print("Results parsed from `example.yaml`:")
     print(
         json.dumps(
@@ -23,7 +27,7 @@ def show(config_cls: type[BaseYamlSettings]) -> None:
             indent=2,
         ),
     )
-    print(SEP)
+    print(_sep())
 
 
 @click.command()
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import os
 import pathlib
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
 from pathlib import Path
 from typing import Annotated, Any
 from unittest import mock
@@ -10,19 +14,33 @@ import pytest
 import yaml
 from pydantic import BaseModel, Field
 
+import yaml_settings_pydantic
 from yaml_settings_pydantic import (
     DEFAULT_YAML_FILE_CONFIG_DICT,
     BaseYamlSettings,
     CreateYamlSettings,
     YamlFileConfigDict,
     YamlSettingsConfigDict,
+    compile_subpath,
+    deep_merge,
+    parse_subpath,
     resolve_filepaths,
 )
+from yaml_settings_pydantic.__main__ import main
+
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper  # type: ignore
 
 # logger = logging.getLogger(__name__)
 # logging.basicConfig(level=logging.DEBUG)
 
 
+class _Files(str, Enum):
+    foo = "foo.yaml"
+
+
 class TestCreateYamlSettings:
     def test_reload(self, file_dummies: Any) -> None:
         # Test args
@@ -49,7 +67,7 @@ class TestCreateYamlSettings:
         # Malform a file.
         bad: Path = Settings.__yaml_files__.pop()
         with bad.open("w") as file:
-            yaml.dump([], file)
+            yaml.dump([], file, Dumper=Dumper)
 
         # # NOTE: Loading should not be an error as the files should not be reloaded.
         yaml_settings()
@@ -66,7 +84,7 @@ class TestCreateYamlSettings:
         assert bad.as_posix() in str(err.value), "Missing required path in message."
 
         with bad.open("w") as file:
-            yaml.dump({}, file)
+            yaml.dump({}, file, Dumper=Dumper)
 
         yaml_settings()
 
@@ -106,9 +124,17 @@ class TestCreateYamlSettings:
     @pytest.mark.parametrize(
         "yaml_files",
         [
+            "foo.yaml",
             Path("foo.yaml"),
             {Path("foo.yaml")},
+            {"foo.yaml"},
+            ("foo.yaml",),
+            frozenset((Path("foo.yaml"),)),
             {Path("foo.yaml"): YamlFileConfigDict(required=True, subpath=None)},
+            {"foo.yaml": YamlFileConfigDict()},
+            OrderedDict({Path("foo.yaml"): YamlFileConfigDict()}),
+            _Files.foo,
+            [_Files.foo],
         ],
     )
     def test_hydration_yaml_files(self, yaml_files: Any) -> None:
@@ -123,6 +149,22 @@ class TestCreateYamlSettings:
         assert foo.get("required"), "Required is always ``True`` by default."
         assert not foo.get("subpath"), "Subpath is never set."
 
+    @pytest.mark.parametrize("yaml_files", [1, (1,), {"foo.yaml": 1}, dict()])
+    def test_hydration_invalid(self, yaml_files: Any) -> None:
+        with pytest.raises(ValueError):
+            self.from_model_config(yaml_files=yaml_files)
+
+    def test_hydration_defaults(self) -> None:
+        config = YamlFileConfigDict(envvar="FOO_PATH")
+        make, _ = self.from_model_config(yaml_files={Path("foo.yaml"): config})
+
+        assert make.files[Path("foo.yaml")] == YamlFileConfigDict(
+            envvar="FOO_PATH",
+            subpath=None,
+            required=True,
+        )
+        assert config == YamlFileConfigDict(envvar="FOO_PATH"), "Input mutated."
+
     def test_yaml_not_required(self) -> None:
         # Should not raise error
         make, Settings = self.from_model_config(
@@ -144,6 +186,266 @@ class TestCreateYamlSettings:
 
         assert str(err.value)
 
+    def test_not_a_dictionary(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "settings.yaml"
+        path.write_text("whatever: [1, 2]")
+
+        make, _ = self.from_model_config(
+            yaml_files={path: YamlFileConfigDict(subpath="whatever")},
+        )
+        with pytest.raises(ValueError) as err:
+            make.load()
+
+        assert f"`file={path}`" in str(err.value)
+        assert "`subpath=whatever`" in str(err.value)
+
+    def test_dictionary_at_subpath(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "settings.yaml"
+        path.write_text("- whatever: 1")
+
+        make, _ = self.from_model_config(
+            yaml_files={path: YamlFileConfigDict(subpath="$[0]")},
+        )
+        assert make.load() == {"whatever": 1}
+
+    @pytest.mark.parametrize("reload", [True, False])
+    def test_source_reused(self, tmp_path: pathlib.Path, reload: bool) -> None:
+        path = tmp_path / "settings.yaml"
+        path.write_text("whatever: before")
+
+        class Settings(BaseYamlSettings):
+            model_config = YamlSettingsConfigDict(
+                yaml_files=path,
+                yaml_reload=reload,
+            )
+
+            whatever: str
+
+        assert Settings().whatever == "before"
+        path.write_text("whatever: after")
+        assert Settings().whatever == ("after" if reload else "before")
+
+    def test_clear_cache(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        before, after = tmp_path / "before.yaml", tmp_path / "after.yaml"
+        before.write_text("whatever: before")
+        after.write_text("whatever: after")
+
+        class Settings(BaseYamlSettings):
+            model_config = YamlSettingsConfigDict(yaml_files=before)
+
+            whatever: str
+
+        assert Settings().whatever == "before"
+        monkeypatch.setitem(Settings.model_config, "yaml_files", after)
+        assert Settings().whatever == "before"
+
+        CreateYamlSettings.clear_cache(Settings)
+        assert Settings().whatever == "after"
+
+    def test_validated_once(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "settings.yaml"
+        _, Settings = self.from_model_config(yaml_files=path)
+
+        with mock.patch.object(
+            CreateYamlSettings,
+            "validate_files",
+            side_effect=AssertionError("Should not validate again."),
+        ):
+            a, b = CreateYamlSettings(Settings), CreateYamlSettings(Settings)
+
+        assert a.files == b.files
+        assert a.files[path] is not b.files[path]
+
+        # NOTE: Sources that validate differently do not share results.
+        class NotRequired(CreateYamlSettings):
+            def validate_files(self, settings_cls: Any) -> Any:
+                files = super().validate_files(settings_cls)
+                return {
+                    fp: {**fp_config, "required": False}
+                    for fp, fp_config in files.items()
+                }
+
+        assert not NotRequired(Settings).files[path]["required"]
+        assert CreateYamlSettings(Settings).files[path]["required"]
+
+    def test_file_cache(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "settings.yaml"
+        path.write_text("whatever: before")
+        make, _ = self.from_model_config(yaml_files=path)
+
+        # NOTE: Recently modified files are not cached.
+        assert make.load() == {"whatever": "before"}
+        assert path not in CreateYamlSettings._file_cache
+
+        old = time.time() - 60
+        os.utime(path, (old, old))
+        assert make.load() == {"whatever": "before"}
+        assert path in CreateYamlSettings._file_cache
+
+        # NOTE: Changing the modification time invalidates the entry.
+        path.write_text("whatever: after")
+        os.utime(path, (old + 1, old + 1))
+        assert make.load() == {"whatever": "after"}
+
+    @pytest.mark.parametrize("reload", [True, False])
+    def test_loaded_not_shared(
+        self, tmp_path: pathlib.Path, reload: bool
+    ) -> None:
+        path = tmp_path / "settings.yaml"
+        path.write_text("data: {items: [1, 2]}")
+
+        class Settings(BaseYamlSettings):
+            model_config = YamlSettingsConfigDict(
+                yaml_files=path,
+                yaml_reload=reload,
+            )
+
+            data: dict[str, Any]
+
+        Settings().data["items"].append(99)
+        assert Settings().data == {"items": [1, 2]}, "Loaded content mutated."
+
+    def test_file_cache_not_shared(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "settings.yaml"
+        path.write_text("data: {items: [1, 2]}")
+        old = time.time() - 60
+        os.utime(path, (old, old))
+
+        def create_settings() -> Any:
+            class Settings(BaseYamlSettings):
+                model_config = YamlSettingsConfigDict(
+                    yaml_files=path,
+                    yaml_reload=True,
+                )
+
+                data: Any
+
+            return Settings
+
+        A, B = create_settings(), create_settings()
+        A().data["items"].append(99)
+        assert A().data == {"items": [1, 2]}, "Cached content was mutated."
+        assert B().data == {"items": [1, 2]}, "Cached content was mutated."
+
+    def test_file_cache_bounded(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(yaml_settings_pydantic, "FILE_CACHE_MAXSIZE", 2)
+        monkeypatch.setattr(CreateYamlSettings, "_file_cache", OrderedDict())
+
+        old = time.time() - 60
+        paths = [tmp_path / f"settings-{index}.yaml" for index in range(3)]
+        for index, path in enumerate(paths):
+            path.write_text(f"whatever: {index}")
+            os.utime(path, (old, old))
+            make, _ = self.from_model_config(yaml_files=path)
+            assert make.load() == {"whatever": index}
+
+        assert list(CreateYamlSettings._file_cache) == paths[1:]
+
+    def test_file_cache_locked(
+        self, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        class LockedCache(OrderedDict):  # type: ignore[type-arg]
+            """Fail whenever the cache is used without holding the lock."""
+
+            def get(self, *args: Any) -> Any:
+                assert CreateYamlSettings._file_cache_lock.locked()
+                return super().get(*args)
+
+            def __setitem__(self, *args: Any) -> None:
+                assert CreateYamlSettings._file_cache_lock.locked()
+                super().__setitem__(*args)
+
+            def move_to_end(self, *args: Any) -> None:
+                assert CreateYamlSettings._file_cache_lock.locked()
+                super().move_to_end(*args)
+
+        monkeypatch.setattr(CreateYamlSettings, "_file_cache", LockedCache())
+
+        path = tmp_path / "settings.yaml"
+        path.write_text("whatever: before")
+        old = time.time() - 60
+        os.utime(path, (old, old))
+
+        make, _ = self.from_model_config(yaml_files=path)
+        assert make.load() == make.load() == {"whatever": "before"}
+        assert path in CreateYamlSettings._file_cache
+
+    @pytest.mark.parametrize(
+        "n_files, pooled",
+        [
+            (yaml_settings_pydantic.READ_POOL_THRESHOLD - 1, False),
+            (yaml_settings_pydantic.READ_POOL_THRESHOLD, True),
+        ],
+    )
+    def test_read_concurrently(
+        self, tmp_path: pathlib.Path, n_files: int, pooled: bool
+    ) -> None:
+        paths = [tmp_path / f"settings-{i}.yaml" for i in range(n_files)]
+        for index, path in enumerate(paths):
+            path.write_text(f"whatever: {index}\nfile{index}: {index}")
+
+        make, _ = self.from_model_config(
+            yaml_files={path: YamlFileConfigDict() for path in paths},
+        )
+        patch_executor = mock.patch.object(
+            yaml_settings_pydantic,
+            "ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        )
+        patch_read_bytes = mock.patch.object(
+            Path,
+            "read_bytes",
+            autospec=True,
+            side_effect=Path.read_bytes,
+        )
+        with patch_executor as executor, patch_read_bytes as read_bytes:
+            loaded = make.load()
+
+        expected = {f"file{index}": index for index in range(n_files)}
+        assert loaded == {"whatever": n_files - 1, **expected}
+        assert read_bytes.call_count == len(paths), "Each file is read once."
+        assert executor.called == pooled, "Pool is used from the threshold."
+
+    def test_parse_error_names_file(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "bad.yaml"
+        path.write_text("a: [1\nb")
+
+        make, _ = self.from_model_config(yaml_files=path)
+        with pytest.raises(yaml.YAMLError) as err:
+            make.load()
+
+        assert f'in "{path}"' in str(err.value)
+
+    def test_json(self, tmp_path: pathlib.Path) -> None:
+        path_json = tmp_path / "settings.json"
+        path_json.write_text('{"whatever": {"nested": [1, 2.5, null, true]}}')
+        path_yaml = tmp_path / "settings.yaml"
+        path_yaml.write_text("whatever: {other: yaml}")
+
+        make, _ = self.from_model_config(
+            yaml_files={
+                path_json: YamlFileConfigDict(),
+                path_yaml: YamlFileConfigDict(),
+            },
+        )
+        assert make.load() == {
+            "whatever": {"nested": [1, 2.5, None, True], "other": "yaml"}
+        }
+
+    def test_json_error_names_file(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "settings.json"
+        path.write_text('{"whatever": 1,}')
+
+        make, _ = self.from_model_config(yaml_files=path)
+        with pytest.raises(ValueError) as err:
+            make.load()
+
+        assert f"`{path}`" in str(err.value)
+
     def test_envvar(self, tmp_path: pathlib.Path) -> None:
 
         # ------------------------------------------------------------------- #
@@ -174,8 +476,10 @@ class TestCreateYamlSettings:
         with Path.open(path_default, "w") as file_default, Path.open(
             path_other, "w"
         ) as file_other:
-            yaml.dump(default.model_dump(mode="json"), file_default)
-            yaml.dump(other.model_dump(mode="json"), file_other)
+            yaml.dump(
+                default.model_dump(mode="json"), file_default, Dumper=Dumper
+            )
+            yaml.dump(other.model_dump(mode="json"), file_other, Dumper=Dumper)
 
         # ------------------------------------------------------------------- #
         # NOTE: Actual tests.
@@ -200,3 +504,63 @@ class TestCreateYamlSettings:
 
             settings = Settings.model_validate({})
             assert settings.whatever == "default"
+
+
+def test_parse_subpath_is_cached() -> None:
+    subpath = "nested.config.[0]"
+    assert parse_subpath(subpath) is parse_subpath(subpath)
+
+
+@pytest.mark.parametrize(
+    "subpath",
+    [
+        "nested",
+        "nested.config",
+        "nested.config.[0]",
+        "nested.missing",
+        "$.nested.config",
+    ],
+)
+def test_compile_subpath_matches_jsonpath(subpath: str) -> None:
+    content = {"nested": {"config": [{"foo": None}], "where": 1}}
+    found = [match.value for match in parse_subpath(subpath).find(content)]
+
+    if not found:
+        with pytest.raises(KeyError):
+            compile_subpath(subpath)(content)
+    else:
+        assert compile_subpath(subpath)(content) == found[0]
+
+
+def test_deep_merge() -> None:
+    first = {"a": {"b": 1, "c": {"d": 2}}, "e": 3}
+    second = {"a": {"c": {"d": 4, "f": 5}}, "e": {"g": 6}}
+
+    merged = deep_merge(deep_merge({}, first), second)
+    assert merged == {"a": {"b": 1, "c": {"d": 4, "f": 5}}, "e": {"g": 6}}
+    assert first == {"a": {"b": 1, "c": {"d": 2}}, "e": 3}, "Input mutated."
+    assert second == {"a": {"c": {"d": 4, "f": 5}}, "e": {"g": 6}}, (
+        "Input mutated."
+    )
+
+
+@pytest.mark.parametrize(
+    "argv, status, output",
+    [
+        (
+            ("yaml_settings_pydantic", "version"),
+            0,
+            yaml_settings_pydantic.__version__,
+        ),
+        (("yaml_settings_pydantic", "spam"), 1, "Invalid command"),
+        (("yaml_settings_pydantic",), 1, "Invalid command"),
+    ],
+)
+def test_main(
+    argv: tuple[str, ...],
+    status: int,
+    output: str,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    assert main(*argv) == status
+    assert capsys.readouterr().out == f"{output}\n"
@@ -8,10 +8,14 @@ from typing import Any
 from unittest import mock
 
 import pytest
+from click.testing import CliRunner
 from pydantic_settings import SettingsConfigDict
-from typing_extensions import LiteralString
 
 from .examples import ExplicitSettings, MinimalSettings, SubpathSettings
+from .examples.__main__ import main
+
+EXAMPLES_DIR: Path = Path(__file__).parent / "examples"
+EXAMPLE_ENV: Path = EXAMPLES_DIR / "example.env"
 
 
 @pytest.mark.parametrize(
@@ -74,7 +78,7 @@ class TestExampleCanOverWrite:
         model_config = SettingsConfigDict(
             env_prefix="MY_SETTINGS_",
             env_nested_delimiter="__",
-            env_file=Path(__file__).parent / "examples" / "example.env",
+            env_file=EXAMPLE_ENV,
         )
         namespace = {"model_config": model_config}
         SettingsWEnv = type("ExplicitSettingsWEnv", (Settings,), namespace)
@@ -85,33 +89,44 @@ class TestExampleCanOverWrite:
             raise ValueError
 
 
+def check_example_output(out: str) -> None:
+    if not out:
+        raise ValueError
+
+    lines = out.split("\n")
+    assert "=============" in lines[0]
+    assert "=============" in lines[-2]
+    assert "Result" in lines[1]
+
+    try:
+        # Verify that the body is valid JSON
+        json.loads("".join(lines[2:-2]))
+    except json.JSONDecodeError as e:
+        print(e.msg)
+
+
 @pytest.mark.parametrize(
     "subcommand",
     ["minimal-settings", "explicit-settings", "subpath-settings"],
 )
-def test_example_execution(subcommand: str | None) -> None:
-    command = ["python", "-m", "tests.examples"]
-    if subcommand is not None:
-        command.append(subcommand)
+def test_example_execution(subcommand: str) -> None:
+    result = CliRunner().invoke(main, [subcommand])
+    print(result.output)
+    assert result.exit_code == 0, "Bad exit code."
+
+    check_example_output(result.output)
+
+
+def test_example_execution_subprocess() -> None:
+    """Smoke test the ``python -m tests.examples`` entrypoint itself."""
+
+    command = ["python", "-m", "tests.examples", "minimal-settings"]
     result = subprocess.run(  # noqa: S603
         command,
         stderr=subprocess.STDOUT,
         stdout=subprocess.PIPE,
     )
-    out: str | list[LiteralString] | list[str]
     print(result.stdout)
     assert result.returncode == 0, "Bad exit code."
 
-    if not (out := result.stdout.decode()):
-        raise ValueError
-
-    out = out.split("\n")
-    assert "=============" in out[0]
-    assert "=============" in out[-2]
-    assert "Result" in out[1]
-
-    try:
-        # Verify that the body is valid JSON
-        result = json.loads("".join(out[2:-2]))
-    except json.JSONDecodeError as e:
-        print(e.msg)
+    check_example_output(result.stdout.decode())
@@ -15,22 +15,42 @@ To include logging, set the environment variable
 
 from __future__ import annotations
 
+import json
 import logging
-from collections.abc import Sequence
+import os
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache, reduce
+from io import BytesIO
 from os import environ
-from pathlib import Path, PosixPath
+from pathlib import Path
+from stat import S_ISREG
+from threading import Lock
+from time import time_ns
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Literal, TypeVar
+from weakref import WeakKeyDictionary
 
-from jsonpath_ng import parse
 from pydantic.fields import FieldInfo
-from pydantic.v1.utils import deep_update
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
     SettingsConfigDict,
 )
 from typing_extensions import Doc, NotRequired, TypedDict
-from yaml import safe_load
+from yaml import load
+
+if TYPE_CHECKING:
+    from jsonpath_ng import JSONPath
+
+# NOTE: Prefer the ``libyaml`` backed loader, which is much faster than the
+#       pure python ``SafeLoader`` and is available in the standard wheels.
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
 
 __version__ = "2.3.1"
 logger = logging.getLogger("yaml_settings_pydantic")
@@ -39,6 +59,21 @@ if environ.get("YAML_SETTINGS_PYDANTIC_LOGGER") == "true":
     logger.setLevel(logging.DEBUG)
 T = TypeVar("T")
 
+# NOTE: Messages for :meth:`CreateYamlSettings.get_settings_cls_value`.
+MSG_LOOKING_FOR = "Looking for field `%s` as `%s` on `%s`."
+MSG_FOUND = "Found field `%s` as `%s` on `%s`."
+
+# NOTE: File modification times are only as precise as the filesystem clock
+#       tick, so content is only cached once a file has been left alone for
+#       longer than any plausible tick.
+FILE_CACHE_MIN_AGE_NS: int = 2_000_000_000
+FILE_CACHE_MAXSIZE: int = 64
+
+# NOTE: Files are only read in a thread pool once there are enough uncached
+#       files for the overlapping reads to pay for the pool.
+READ_POOL_THRESHOLD: int = 4
+READ_POOL_MAX_WORKERS: int = 8
+
 
 class YamlFileConfigDict(TypedDict, total=False):
     # NOTE: ``NotRequired``
@@ -119,16 +154,239 @@ class YamlSettingsConfigDict(SettingsConfigDict, TypedDict):
     ]
 
 
+@lru_cache(maxsize=128)
+def parse_subpath(subpath: str) -> JSONPath:
+    """Compile :param:`subpath`. Compiled expressions are immutable, so they
+    are cached and shared.
+
+    ``jsonpath_ng`` is imported here, as it is only needed for subpaths that
+    are not simple dotted paths.
+    """
+
+    from jsonpath_ng.parser import parse
+
+    return parse(subpath)
+
+
+# NOTE: Dotted paths of plain field names, e.g. ``app.database``. Reserved
+#       words of the ``jsonpath_ng`` lexer are excluded by
+#       :func:`compile_subpath`.
+SIMPLE_SUBPATH = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*")
+SIMPLE_SUBPATH_RESERVED = frozenset({"where", "wherenot"})
+
+
+@lru_cache(maxsize=128)
+def compile_subpath(subpath: str) -> Callable[[Any], Any]:
+    """Compile :param:`subpath` into a function that returns its first match.
+
+    Simple dotted paths are resolved by walking dictionaries directly, all
+    other expressions are evaluated by ``jsonpath_ng``. Either way, the
+    returned function raises ``KeyError`` when there is no match.
+    """
+
+    keys = tuple(subpath.split("."))
+    is_simple = SIMPLE_SUBPATH.fullmatch(subpath) is not None
+    if is_simple and SIMPLE_SUBPATH_RESERVED.isdisjoint(keys):
+
+        def find_simple(content: Any) -> Any:
+            for key in keys:
+                if not isinstance(content, dict) or key not in content:
+                    raise KeyError(subpath)
+                content = content[key]
+            return content
+
+        return find_simple
+
+    jsonpath_exp = parse_subpath(subpath)
+
+    def find(content: Any) -> Any:
+        if (match := next(iter(jsonpath_exp.find(content)), None)) is None:
+            raise KeyError(subpath)
+        return match.value
+
+    return find
+
+
+def deep_merge(dst: dict[str, Any], src: dict[str, Any]) -> dict[str, Any]:
+    """Recursively merge :param:`src` into :param:`dst`, in place.
+
+    Nested dictionaries are merged key by key, anything else in :param:`src`
+    overwrites :param:`dst`. Everything taken from :param:`src` is copied, so
+    :param:`dst` never shares mutable values (e.g. lists) with :param:`src`,
+    which may be cached content.
+
+    :returns: :param:`dst`.
+    """
+
+    stack = [(dst, src)]
+    while stack:
+        into, update = stack.pop()
+        for key, value in update.items():
+            if isinstance(value, dict):
+                if not isinstance(target := into.get(key), dict):
+                    into[key] = target = dict()
+                stack.append((target, value))
+            else:
+                into[key] = deepcopy(value)
+
+    return dst
+
+
+def stat_file(fp: Path) -> os.stat_result | None:
+    """Stat :param:`fp`.
+
+    :returns: The ``stat`` result, or ``None`` when :param:`fp` is not an
+        existing regular file.
+    """
+
+    try:
+        stat = fp.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+    return stat if S_ISREG(stat.st_mode) else None
+
+
+def load_yaml(fp: Path, data: bytes) -> Any:
+    """Parse :param:`data`, read from :param:`fp`, as ``YAML``.
+
+    The buffer is wrapped in a stream named after :param:`fp`, so that parser
+    errors still say which file is broken.
+    """
+
+    stream = BytesIO(data)
+    stream.name = str(fp)
+    return load(stream, Loader=YamlLoader)
+
+
+def load_json(fp: Path, data: bytes) -> Any:
+    """Parse :param:`data`, read from :param:`fp`, as strict ``JSON``.
+
+    :raises: ``ValueError`` naming :param:`fp` when it is not valid ``JSON``.
+    """
+
+    try:
+        return json.loads(data)
+    except ValueError as err:
+        raise ValueError(f"Could not parse `{fp}` as `JSON`: {err}") from err
+
+
+def stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+    """Key that content loaded for :param:`stat` is cached with."""
+
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=64)
+def path_from_env(value: str) -> Path:
+    """Parse the path found in an environment variable.
+
+    Only the parsing is cached, ``environ`` is read by
+    :func:`resolve_filepaths` on every call so that changes are respected.
+    """
+
+    return Path(value)
+
+
 def resolve_filepaths(fp: Path, fp_config: YamlFileConfigDict) -> Path:
 
     fp_from_env = None
     if (fp_env_var := fp_config.get("envvar")) is not None:
         fp_from_env = environ.get(fp_env_var)
 
-    fp_final = fp if not fp_from_env else Path(fp_from_env)
+    fp_final = fp if not fp_from_env else path_from_env(fp_from_env)
     return fp_final
 
 
+def as_path(value: Path | str) -> Path:
+    """Convert :param:`value` to a ``Path``.
+
+    ``str`` subclasses are converted through ``str.__str__``, since their
+    ``__str__`` (e.g. that of ``str`` enums) need not return their value.
+    """
+
+    return value if isinstance(value, Path) else Path(str.__str__(value))
+
+
+def hydrate_files_path(
+    value: Path, item: str
+) -> dict[Path, YamlFileConfigDict]:
+    logger.debug("`%s` was a Path.", item)
+    return {value: DEFAULT_YAML_FILE_CONFIG_DICT.copy()}
+
+
+def hydrate_files_str(value: str, item: str) -> dict[Path, YamlFileConfigDict]:
+    logger.debug("`%s` was a String.", item)
+    return {as_path(value): DEFAULT_YAML_FILE_CONFIG_DICT.copy()}
+
+
+def check_files_keys(value: Iterable[Any], item: str) -> None:
+    """Raise ``ValueError`` unless every path in :param:`value` is a string
+    or ``Path``.
+    """
+
+    keys_invalid = {k for k in value if not isinstance(k, (Path, str))}
+    if len(keys_invalid):
+        raise ValueError(
+            f"All items in `{item}` must be strings or paths. The following "
+            f"are not: `{keys_invalid}`."
+        )
+
+
+def hydrate_files_paths(
+    value: Sequence[Path | str] | set[Path | str], item: str
+) -> dict[Path, YamlFileConfigDict]:
+    """Hydrate a collection of paths with the default configuration."""
+
+    check_files_keys(value, item)
+    return {as_path(k): DEFAULT_YAML_FILE_CONFIG_DICT.copy() for k in value}
+
+
+def hydrate_files_dict(
+    value: dict[Path | str, YamlFileConfigDict], item: str
+) -> dict[Path, YamlFileConfigDict]:
+    """Hydrate a mapping of paths to their configuration, filling in the
+    defaults without mutating :param:`value`.
+    """
+
+    check_files_keys(value, item)
+    if any(not isinstance(v, dict) for v in value.values()):
+        raise ValueError(f"`{item}` values must have type `dict`.")
+    elif not len(value):
+        raise ValueError("`files` cannot have length `0`.")
+
+    return {
+        as_path(k): {
+            **DEFAULT_YAML_FILE_CONFIG_DICT,
+            **v,
+        }
+        for k, v in value.items()
+    }
+
+
+FILES_HYDRATORS: dict[
+    type, Callable[[Any, str], dict[Path, YamlFileConfigDict]]
+] = {
+    str: hydrate_files_str,
+    list: hydrate_files_paths,
+    tuple: hydrate_files_paths,
+    set: hydrate_files_paths,
+    frozenset: hydrate_files_paths,
+    dict: hydrate_files_dict,
+}
+
+
+# NOTE: Validated ``(reload, files)`` for each settings class, and for each
+#       class of source validating it (as subclasses of
+#       :class:`CreateYamlSettings` may validate differently). These only
+#       depend on the classes, so validation runs once per pair.
+VALIDATED_SETTINGS_CLS: WeakKeyDictionary[
+    type[BaseSettings],
+    dict[type[CreateYamlSettings], tuple[bool, dict[Path, YamlFileConfigDict]]],
+]
+VALIDATED_SETTINGS_CLS = WeakKeyDictionary()
+
+
 class CreateYamlSettings(PydanticBaseSettingsSource):
     """Create a ``yaml`` setting loader middleware.
 
@@ -137,6 +395,11 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
     ``model_config`` on ``settings_cls.model_config``.
     """
 
+    # NOTE: ``PydanticBaseSettingsSource`` does not declare ``__slots__``, so
+    #       instances keep a ``__dict__`` for the attributes it sets. The
+    #       attributes used on every load are slots nonetheless.
+    __slots__ = ("_loaded", "_loaded_get", "_yaml_data", "files", "reload")
+
     # Info
 
     files: Annotated[
@@ -159,22 +422,74 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
         dict[str, Any] | None,
         Doc("Loaded file(s) content."),
     ]
+    _loaded_get: Annotated[
+        Callable[[str], Any] | None,
+        Doc(
+            "Bound ``get`` of :attr:`_loaded`, set whenever content is "
+            "loaded."
+        ),
+    ]
+    _file_cache: ClassVar[
+        Annotated[
+            OrderedDict[Path, tuple[tuple[int, int, int], Any]],
+            Doc(
+                "Content of previously loaded files keyed by their resolved "
+                "path, along with the ``stat`` results it was loaded for. "
+                "The least recently used entries are evicted beyond "
+                ":data:`FILE_CACHE_MAXSIZE`."
+            ),
+        ]
+    ] = OrderedDict()
+    _file_cache_lock: ClassVar[
+        Annotated[
+            Lock,
+            Doc(
+                "Guards :attr:`_file_cache`, which is shared by sources built "
+                "in any thread."
+            ),
+        ]
+    ] = Lock()
 
     # ----------------------------------------------------------------------- #
     # Top level stuff.
 
     def __init__(self, settings_cls: type[BaseSettings]):
-        self.reload = self.validate_reload(settings_cls)
-        self.files = self.validate_files(settings_cls)
+        validated_by_source = VALIDATED_SETTINGS_CLS.setdefault(
+            settings_cls, dict()
+        )
+        if (validated := validated_by_source.get(type(self))) is None:
+            validated = (
+                self.validate_reload(settings_cls),
+                self.validate_files(settings_cls),
+            )
+            validated_by_source[type(self)] = validated
+
+        # NOTE: Copy the file configs so that instances do not share them.
+        self.reload, files = validated
+        self.files = {fp: fp_config.copy() for fp, fp_config in files.items()}
         self._loaded = None
+        self._loaded_get = None
 
     def __call__(self) -> dict[str, Any]:
         """Yaml settings loader for a single file.
 
         :returns: Yaml from :attr:`files` unmarshalled and combined by update.
+            This is a copy of :attr:`loaded`, as this source (and so
+            :attr:`loaded`) is shared by every instance of ``settings_cls``.
         """
 
-        return self.loaded
+        return deepcopy(self.loaded)
+
+    @classmethod
+    def clear_cache(cls, settings_cls: type[BaseSettings]) -> None:
+        """Forget the validated ``yaml_files`` and ``yaml_reload`` and the
+        source kept for :param:`settings_cls`, so that its next instance
+        reads them again.
+        """
+
+        logger.debug("Clearing YAML settings for `%s`.", settings_cls.__name__)
+        VALIDATED_SETTINGS_CLS.pop(settings_cls, None)
+        YAML_SETTINGS_SOURCES.pop(settings_cls, None)
 
     @property
     def loaded(self) -> dict[str, Any]:
@@ -187,9 +502,11 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
         if self.reload:
             logger.debug("Reloading configuration files.")
             self._loaded = self.load()
+            self._loaded_get = self._loaded.get
         elif self._loaded is None:
             logger.debug("Loading configuration files. Should not reload.")
             self._loaded = self.load()
+            self._loaded_get = self._loaded.get
 
         return self._loaded
 
@@ -198,10 +515,14 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
         field: FieldInfo,
         field_name: str,
     ) -> tuple[Any, str, bool]:
-        """Required by pydantic."""
+        """Required by pydantic.
+
+        Reads the most recently loaded content, only loading when nothing has
+        been loaded yet, so that fields are not reloaded one by one.
+        """
 
-        v = self.loaded.get(field_name)
-        return (v, field_name, False)
+        get = self._loaded_get or self.loaded.get
+        return (get(field_name), field_name, False)
 
     # ----------------------------------------------------------------------- #
     # Field validation.
@@ -225,67 +546,23 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
         found_value = self.get_settings_cls_value(settings_cls, "files", None)
         item = f"{settings_cls.__name__}.model_config.yaml_files"
 
-        # NOTE: Validate is dict/set/Path/str
-        if found_value is None:
-            raise ValueError(f"`{item}` cannot be `None`.")
-        elif (
-            not isinstance(found_value, Path)
-            and not isinstance(found_value, str)
-            and not isinstance(found_value, set)
-            and not isinstance(found_value, dict)
-        ):
-            msg = "`{0}` must be a sequence or set, got type `{1}`."
-            raise ValueError(msg.format(item, type(found_value)))
-        # NOTE: Not including makes the editor think the the code below is
-        #       unreachable, I do not know why, so the ``else`` statement shall
-        #       remain.
-        else:
-            ...
-
-        # NOTE: If its a string/``Path``, make it into a tuple. If it is anything
-        #       else just leave it.
-        values: (
-            tuple[Path, ...]
-            | dict[str, YamlFileConfigDict]
-            | dict[Path, YamlFileConfigDict]
-        )
-        if isinstance(found_value, PosixPath):
-            logger.debug(f"`{item}` was a PosixPath.")
-            values = (found_value,)
+        # NOTE: Dispatch on the exact type. Subclasses (e.g. every ``Path``,
+        #       ``OrderedDict``, or ``str`` enums) fall back to ``isinstance``.
+        if (hydrate := FILES_HYDRATORS.get(type(found_value))) is not None:
+            return hydrate(found_value, item)
+        elif isinstance(found_value, Path):
+            return hydrate_files_path(found_value, item)
+        elif isinstance(found_value, dict):
+            return hydrate_files_dict(found_value, item)
         elif isinstance(found_value, str):
-            logger.debug(f"`{item}` was a String.")
-            values = (Path(found_value),)
-        else:
-            values = found_value
-
-        keys_invalid = {item for item in values if not isinstance(item, Path)}
-        if len(keys_invalid):
-            raise ValueError(
-                "All items in `files` must be strings. The following are "
-                f"not strings: `{keys_invalid}`."
-            )
+            return hydrate_files_str(found_value, item)
+        elif isinstance(found_value, (list, tuple, set, frozenset)):
+            return hydrate_files_paths(found_value, item)
+        elif found_value is None:
+            raise ValueError(f"`{item}` cannot be `None`.")
 
-        # NOTE: Create dictionary if the sequence is not a dictionary.
-        files: dict[Path, YamlFileConfigDict]
-        if not isinstance(values, dict):
-            files = {
-                (
-                    k if isinstance(k, Path) else Path(k)
-                ): DEFAULT_YAML_FILE_CONFIG_DICT.copy()
-                for k in values
-            }
-        elif any(not isinstance(v, dict) for v in values.values()):
-            raise ValueError(f"`{item}` values must have type `dict`.")
-        elif not len(values):
-            raise ValueError("`files` cannot have length `0`.")
-        else:
-            for k, v in values.items():
-                vv = DEFAULT_YAML_FILE_CONFIG_DICT.copy()
-                vv.update(v)
-                values[k] = v
-            files = values
-
-        return files
+        msg = "`{0}` must be a sequence or set, got type `{1}`."
+        raise ValueError(msg.format(item, type(found_value)))
 
     def get_settings_cls_value(
         self,
@@ -297,27 +574,28 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
         :param:`settings_cls` and then :attr:`settings_cls.model_config`, if
         neither of these are found return :param:`default`.
         """
-        # Bc logging
-        _msg = "Looking for field `%s` as `%s` on `%s`."
-        _msg_found = _msg.replace("Looking for", "Found")
-
         # Bc naming
         cls_field = f"__yaml_{field}__"
         config_field = f"yaml_{field}"
 
         # Look for dunder source
-        logger.debug(_msg, f"__{field}__", config_field, "settings_cls")
+        logger.debug(MSG_LOOKING_FOR, field, cls_field, "settings_cls")
         out = default
         if (dunder := getattr(settings_cls, cls_field, None)) is not None:
-            logger.debug(_msg_found, field, config_field, "settings_cls")
+            logger.debug(MSG_FOUND, field, cls_field, "settings_cls")
             return dunder
 
         # Look for config source
-        logger.debug(_msg, field, config_field, "settings_cls.model_config")
+        logger.debug(
+            MSG_LOOKING_FOR,
+            field,
+            config_field,
+            "settings_cls.model_config",
+        )
         from_conf = settings_cls.model_config.get(config_field)
         if from_conf is not None:
             logger.debug(
-                _msg_found,
+                MSG_FOUND,
                 field,
                 config_field,
                 "settings_cls.model_config",
@@ -337,22 +615,16 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
         fp_data: YamlFileData,
     ) -> tuple[dict[str, Any], Path | None]:
 
-        fp_config = fp_data["config"]
         content = fp_data["content"]
-
-        if (subpath := fp_config.get("subpath")) is not None:
-            jsonpath_exp = parse(subpath)
-
-            extracted = next(iter(jsonpath_exp.find(content)), None)
-            if extracted is None:
+        if (subpath := fp_data["config"].get("subpath")) is not None:
+            try:
+                content = compile_subpath(subpath)(content)
+            except LookupError as err:
                 msg = f"Could not find path `{subpath}` in `{fp}`."
-                raise ValueError(msg)
-
-            extracted = extracted.value
-        else:
-            extracted = content
+                raise ValueError(msg) from err
 
-        return extracted, None if isinstance(content, dict) else fp
+        # NOTE: Only the content at the subpath has to be a dictionary.
+        return content, None if isinstance(content, dict) else fp
 
     def validate_yaml_data(
         self,
@@ -369,22 +641,19 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
         if not yaml_data:
             return dict()
 
-        # NOTE: ``dict`` is included for the case where ``loaded`` has 0 length.
-        content: tuple[dict[str, Any], ...]
-        fp_invalid_unfiltered: tuple[Path | None, ...]
-
-        content, fp_invalid_unfiltered = zip(
-            *(
-                self.validate_yaml_data_content(fp, fp_data)
-                for fp, fp_data in yaml_data.items()
-            ),
-        )
+        content: list[dict[str, Any]] = []
+        fp_invalid: list[Path] = []
+        for fp, fp_data in yaml_data.items():
+            extracted, invalid = self.validate_yaml_data_content(fp, fp_data)
+            content.append(extracted)
+            if invalid is not None:
+                fp_invalid.append(invalid)
 
-        fp_invalid = tuple(fp for fp in fp_invalid_unfiltered if fp is not None)
-        if len(fp_invalid):
+        if fp_invalid:
             fmt = "  - `file={0}`\n`subpath={1}`"
             msg = "\n".join(
-                fmt.format(fp, yaml_data[fp].get("subpath")) for fp in fp_invalid
+                fmt.format(fp, yaml_data[fp]["config"].get("subpath"))
+                for fp in fp_invalid
             )
             msg = (
                 "Input files must deserialize to dictionaries at their "
@@ -393,55 +662,126 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
             raise ValueError(msg)
 
         logger.debug("Merging file results.")
-        return deep_update(*content)
+        return reduce(deep_merge, content, dict())
 
     def load_yaml_data(self) -> dict[Path, YamlFileData]:
         """Load data without validatation."""
 
-        # NOTE: Check that required files exist. Find existing files and handle
-        #       environment variable overwrites.
-        filepaths: dict[tuple[Path, Path], YamlFileConfigDict]
-        filepaths = {
-            (fp_default, resolve_filepaths(fp_default, fp_config)): fp_config
-            for fp_default, fp_config in self.files.items()
-        }
-
         # NOTE: No files to check.
-        if not len(filepaths):
+        if not self.files:
             return dict()
 
+        # NOTE: Resolve (handling environment variable overwrites) and stat
+        #       every file in a single pass, which decides whether it will be
+        #       loaded. Files to load are kept in parallel lists, and their
+        #       ``stat`` results are reused by the content cache.
+        fp_defaults: list[Path] = []
+        fp_resolveds: list[Path] = []
+        fp_configs: list[YamlFileConfigDict] = []
+        stats: list[os.stat_result] = []
+        fp_resolved_required_missing: list[Path] = []
+        for fp_default, fp_config in self.files.items():
+            fp_resolved = resolve_filepaths(fp_default, fp_config)
+            if (stat := stat_file(fp_resolved)) is not None:
+                fp_defaults.append(fp_default)
+                fp_resolveds.append(fp_resolved)
+                fp_configs.append(fp_config)
+                stats.append(stat)
+            elif fp_config.get("required"):
+                fp_resolved_required_missing.append(fp_resolved)
+
         # NOTE: If any required files are missing, raise an error.
-        fp_resolved_required_missing = {
-            fp_resolved
-            for (_, fp_resolved), fp_config in filepaths.items()
-            if fp_config.get("required") and not fp_resolved.is_file()
-        }
         if len(fp_resolved_required_missing):
             raise ValueError(
                 "The following files are required but do not exist: "
                 f"`{fp_resolved_required_missing}`."
             )
 
-        # NOTE: Bulk load files (and bulk manage IO closing/opening).
-        # logger.debug("Loading files %s.", ", ".join(map(str, self.files)))
-        files = {
-            (fp_default, fp_resolved): Path.open(fp_resolved)
-            for (fp_default, fp_resolved) in filepaths
-            if fp_resolved.exists()
-        }
+        # NOTE: Read uncached files concurrently when there are enough of
+        #       them. Parsing holds the GIL, so it is left to ``load_file``.
+        file_cache = self._file_cache
+        with self._file_cache_lock:
+            uncached = [
+                fp_resolved
+                for fp_resolved, stat in dict(zip(fp_resolveds, stats)).items()
+                if (cached := file_cache.get(fp_resolved)) is None
+                or cached[0] != stat_key(stat)
+            ]
+        prefetched: dict[Path, bytes] = dict()
+        if len(uncached) >= READ_POOL_THRESHOLD:
+            logger.debug("Reading `%s` files concurrently.", len(uncached))
+            max_workers = min(READ_POOL_MAX_WORKERS, len(uncached))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                read = executor.map(Path.read_bytes, uncached)
+                prefetched = dict(zip(uncached, read))
+
+        # NOTE: Load files (or reuse their cached content).
         yaml_data: dict[Path, YamlFileData] = {
             fp_default: YamlFileData(
-                content=safe_load(stream),
+                content=self.load_file(
+                    fp_resolved, stat, prefetched.get(fp_resolved)
+                ),
                 source=fp_default,
-                config=filepaths[(fp_default, fp_resolved)],
+                config=fp_config,
+            )
+            for fp_default, fp_resolved, fp_config, stat in zip(
+                fp_defaults, fp_resolveds, fp_configs, stats
             )
-            for (fp_default, fp_resolved), stream in files.items()
         }
-        logger.debug("Closing files.")
-        _ = {file.close() for file in files.values()}  # type: ignore
 
         return yaml_data
 
+    def load_file(
+        self,
+        fp: Path,
+        stat: os.stat_result | None = None,
+        data: bytes | None = None,
+    ) -> Any:
+        """Load the content of :param:`fp`.
+
+        Files with a ``.json`` suffix are parsed as strict ``JSON`` by the
+        ``json`` module, which is much faster than the ``YAML`` loader. Unlike
+        the ``YAML`` loader it rejects comments and trailing commas, and reads
+        numbers like ``1e3`` as floats rather than strings. Everything else is
+        parsed as ``YAML``.
+
+        Content is cached by path, inode, modification time, and size, for at
+        most :data:`FILE_CACHE_MAXSIZE` files. Files modified within
+        :data:`FILE_CACHE_MIN_AGE_NS` are never cached, since an edit in the
+        same timestamp tick would not change the key.
+
+        :param stat: The result of ``fp.stat()``, if the caller already has it.
+        :param data: The content of :param:`fp`, if the caller already read it.
+        """
+
+        if stat is None:
+            stat = fp.stat()
+        key = stat_key(stat)
+        file_cache = self._file_cache
+        with self._file_cache_lock:
+            if (cached := file_cache.get(fp)) is not None and cached[0] == key:
+                file_cache.move_to_end(fp)
+        if cached is not None and cached[0] == key:
+            logger.debug("Using cached content for `%s`.", fp)
+            return cached[1]
+
+        # NOTE: Reading the whole file lets the loader parse a single buffer
+        #       and closes the file before parsing starts.
+        logger.debug("Loading `%s`.", fp)
+        if data is None:
+            data = fp.read_bytes()
+        is_json = fp.suffix.lower() == ".json"
+        content = load_json(fp, data) if is_json else load_yaml(fp, data)
+
+        if time_ns() - stat.st_mtime_ns > FILE_CACHE_MIN_AGE_NS:
+            with self._file_cache_lock:
+                file_cache[fp] = (key, content)
+                file_cache.move_to_end(fp)
+                if len(file_cache) > FILE_CACHE_MAXSIZE:
+                    file_cache.popitem(last=False)
+
+        return content
+
     def load(self) -> dict[str, Any]:
         """Load data and validate that it is sufficiently shaped for
         ``BaseSettings``.
@@ -451,6 +791,10 @@ class CreateYamlSettings(PydanticBaseSettingsSource):
         return self.validate_yaml_data(yaml_data)
 
 
+YAML_SETTINGS_SOURCES: WeakKeyDictionary[type[BaseSettings], CreateYamlSettings]
+YAML_SETTINGS_SOURCES = WeakKeyDictionary()
+
+
 class BaseYamlSettings(BaseSettings):
     """YAML Settings.
 
@@ -485,9 +829,14 @@ class BaseYamlSettings(BaseSettings):
     ) -> tuple[PydanticBaseSettingsSource, ...]:
         """Customizes sources for configuration. See `the pydantic docs<https://docs.pydantic.dev/latest/usage/pydantic_settings/#customise-settings-sources>`_."""
 
-        # Look for YAML files.
-        logger.debug("Creating YAML settings callable for `%s`.", cls.__name__)
-        yaml_settings = CreateYamlSettings(settings_cls)
+        # Look for YAML files. The source is reused for every instance of
+        # ``settings_cls`` so that ``yaml_reload`` can take effect.
+        if (yaml_settings := YAML_SETTINGS_SOURCES.get(settings_cls)) is None:
+            logger.debug(
+                "Creating YAML settings callable for `%s`.", cls.__name__
+            )
+            yaml_settings = CreateYamlSettings(settings_cls)
+            YAML_SETTINGS_SOURCES[settings_cls] = yaml_settings
 
         # The order in which these appear determines their precendence. So a
         # `.env` file could be added to # override the ``YAML`` configuration
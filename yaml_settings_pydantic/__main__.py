@@ -1,18 +1,25 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Callable
 
 from yaml_settings_pydantic import __version__
 
 
+def version() -> int:
+    print(__version__)
+    return 0
+
+
+COMMANDS: dict[str, Callable[[], int]] = {"version": version}
+
+
 def main(*argv: str) -> int:
-    if argv[1] == "version":
-        print(__version__)
-    else:
+    if (command := COMMANDS.get(argv[1] if len(argv) > 1 else "")) is None:
         print("Invalid command")
         return 1
 
-    return 0
+    return command()
 
 
 if __name__ == "__main__":